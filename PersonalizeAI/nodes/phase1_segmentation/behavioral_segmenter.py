@@ -4,22 +4,21 @@ Exposes `run(state)` that appends candidate segment(s).
 """
 from typing import Dict
 
+# Fixed segment results: (id, description, confidence).
+_ENGAGED_SUBSCRIBER = ("engaged_subscriber", "Users likely to subscribe or sign up.", 0.75)
+_TRIAL_SEEKERS = ("trial_seekers", "Users looking for a demo or trial.", 0.7)
+_BROWSERS = ("browsers", "Casual browsers with low conversion signals.", 0.45)
+
 
 def run(state: Dict) -> Dict:
     msg = (state.get("user_message") or "").lower()
     # Example heuristics: look for engagement verbs
     if any(k in msg for k in ("subscribe", "signup", "register")):
-        segment = "engaged_subscriber"
-        desc = "Users likely to subscribe or sign up."
-        confidence = 0.75
+        segment, desc, confidence = _ENGAGED_SUBSCRIBER
     elif any(k in msg for k in ("demo", "trial", "try")):
-        segment = "trial_seekers"
-        desc = "Users looking for a demo or trial."
-        confidence = 0.7
+        segment, desc, confidence = _TRIAL_SEEKERS
     else:
-        segment = "browsers"
-        desc = "Casual browsers with low conversion signals."
-        confidence = 0.45
+        segment, desc, confidence = _BROWSERS
 
     state.setdefault("candidate_segments", []).append({
         "id": segment,
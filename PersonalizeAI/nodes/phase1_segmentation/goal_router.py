@@ -2,26 +2,42 @@
 
 Returns the node id to run next given the GraphState.
 """
+import re
+from collections.abc import Iterable
 from typing import Dict
 
 
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive substring alternation."""
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+
+
+# Keyword groups are compiled once at import so routing does not lowercase the
+# goal/message or rescan them once per keyword on every call.
+_RFM_GOAL = _keyword_pattern(("rfm", "recency", "monetary", "frequency"))
+_INTENT_GOAL = _keyword_pattern(("intent", "buy", "pricing", "purchase"))
+_INTENT_MSG = _keyword_pattern(("buy", "purchase", "pricing"))
+_BEHAVIOR_GOAL = _keyword_pattern(("behavior", "engagement", "demo", "trial"))
+_BEHAVIOR_MSG = _keyword_pattern(("demo", "trial", "signup"))
+
+
 def goal_router(state: Dict) -> str:
     """Return a segmentation node id based on campaign_goal or user_message.
 
     Possible return values: RFM_SEGMENTATION, INTENT_SEGMENTATION,
     BEHAVIORAL_SEGMENTATION, PROFILE_SEGMENTATION
     """
-    goal = (state.get("campaign_goal") or "").lower()
-    msg = (state.get("user_message") or "").lower()
+    goal = state.get("campaign_goal") or ""
+    msg = state.get("user_message") or ""
 
     # Priority: explicit keywords in the campaign_goal, then user_message
-    if any(k in goal for k in ("rfm", "recency", "monetary", "frequency")):
+    if _RFM_GOAL.search(goal):
         return "RFM_SEGMENTATION"
 
-    if any(k in goal for k in ("intent", "buy", "pricing", "purchase")) or any(k in msg for k in ("buy", "purchase", "pricing")):
+    if _INTENT_GOAL.search(goal) or _INTENT_MSG.search(msg):
         return "INTENT_SEGMENTATION"
 
-    if any(k in goal for k in ("behavior", "engagement", "demo", "trial")) or any(k in msg for k in ("demo", "trial", "signup")):
+    if _BEHAVIOR_GOAL.search(goal) or _BEHAVIOR_MSG.search(msg):
         return "BEHAVIORAL_SEGMENTATION"
 
     # Fallback to profile-based segmentation when campaign is audience/profile oriented
@@ -4,22 +4,21 @@ Exposes `run(state)` that appends candidate segment(s).
 """
 from typing import Dict
 
+# Possible results as (segment id, description, confidence).
+_PURCHASE_INTENT = ("purchase_intent", "Users expressing purchase intent.", 0.8)
+_RESEARCHERS = ("researchers", "Users researching or learning about products.", 0.6)
+_GENERAL_INTEREST = ("general_interest", "General interest / engagement segment.", 0.5)
+
 
 def run(state: Dict) -> Dict:
     msg = (state.get("user_message") or "").lower()
 
     if any(k in msg for k in ("buy", "purchase", "pricing", "price")):
-        segment = "purchase_intent"
-        desc = "Users expressing purchase intent."
-        confidence = 0.8
+        segment, desc, confidence = _PURCHASE_INTENT
     elif any(k in msg for k in ("info", "learn", "learn more", "details")):
-        segment = "researchers"
-        desc = "Users researching or learning about products."
-        confidence = 0.6
+        segment, desc, confidence = _RESEARCHERS
     else:
-        segment = "general_interest"
-        desc = "General interest / engagement segment."
-        confidence = 0.5
+        segment, desc, confidence = _GENERAL_INTEREST
 
     state.setdefault("candidate_segments", []).append({
         "id": segment,
@@ -4,23 +4,22 @@ Exposes `run(state)` that appends candidate segment(s).
 """
 from typing import Dict
 
+# Profile segments as (id, description, confidence) triples.
+_ENTERPRISE_ACCOUNTS = ("enterprise_accounts", "Enterprise / B2B customer profile.", 0.8)
+_EDUCATION = ("education", "Education / student segment.", 0.6)
+_CONSUMER = ("consumer", "General consumer profile.", 0.5)
+
 
 def run(state: Dict) -> Dict:
     # Example profile segmentation: check for demographic keywords
     goal = (state.get("campaign_goal") or "").lower()
 
     if "enterprise" in goal or "b2b" in goal:
-        segment = "enterprise_accounts"
-        desc = "Enterprise / B2B customer profile."
-        confidence = 0.8
+        segment, desc, confidence = _ENTERPRISE_ACCOUNTS
     elif "student" in goal or "education" in goal:
-        segment = "education"
-        desc = "Education / student segment."
-        confidence = 0.6
+        segment, desc, confidence = _EDUCATION
     else:
-        segment = "consumer"
-        desc = "General consumer profile."
-        confidence = 0.5
+        segment, desc, confidence = _CONSUMER
 
     state.setdefault("candidate_segments", []).append({
         "id": segment,
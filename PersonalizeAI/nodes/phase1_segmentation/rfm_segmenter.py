@@ -4,6 +4,10 @@ This module exposes `run(state)` which returns an updated GraphState.
 """
 from typing import Dict
 
+# (segment id, description, confidence) for each outcome, built once at import.
+_AT_RISK = ("at_risk", "Customers likely to churn (RFM: low recency/high churn signals).", 0.7)
+_HIGH_VALUE = ("high_value", "High value customers based on recent/large purchases.", 0.6)
+
 
 def run(state: Dict) -> Dict:
     # Very simple RFM-like logic based on keywords in user_message or campaign_goal
@@ -11,13 +15,9 @@ def run(state: Dict) -> Dict:
     goal = (state.get("campaign_goal") or "").lower()
 
     if "churn" in msg or "churn" in goal:
-        segment = "at_risk"
-        desc = "Customers likely to churn (RFM: low recency/high churn signals)."
-        confidence = 0.7
+        segment, desc, confidence = _AT_RISK
     else:
-        segment = "high_value"
-        desc = "High value customers based on recent/large purchases."
-        confidence = 0.6
+        segment, desc, confidence = _HIGH_VALUE
 
     state.setdefault("candidate_segments", []).append({
         "id": segment,
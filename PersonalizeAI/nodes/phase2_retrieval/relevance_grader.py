@@ -3,21 +3,25 @@
 Acts as an LLM-as-a-Judge simulation; returns the next node id based on
 whether retrieved content contains product facts relevant to the segment.
 """
+import re
 from typing import Dict
 from PersonalizeAI.state import GraphState
 
 
+# Product keywords that mark a snippet as relevant. Matched case-insensitively
+# against the raw snippet text so no lowercased copy is made per document.
+_PRODUCT_KEYWORDS_RE = re.compile(r"protein|sugar|ingredient|feature", re.IGNORECASE)
+
+
 def relevance_grader(state: GraphState) -> str:
     """Return either 'CITATION_FORMATTER' or 'SELF_CORRECTION'."""
     retrieved_content = state.get("retrieved_content", []) or []
-    segment_desc = (state.get("segment_description") or "").lower()
 
     is_relevant = False
 
     # Simple rule: if any snippet contains common product keywords, mark relevant
     for doc in retrieved_content:
-        text = (doc.get("text") or "").lower()
-        if any(k in text for k in ("protein", "sugar", "ingredient", "feature")):
+        if _PRODUCT_KEYWORDS_RE.search(doc.get("text") or ""):
             is_relevant = True
             break
 
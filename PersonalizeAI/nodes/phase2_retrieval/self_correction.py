@@ -9,6 +9,8 @@ root. For compatibility with various test runners, it also writes the same
 entry to an alternate ancestor path when that ancestor exists.
 """
 from typing import Dict, Any, Optional
+import asyncio
+import functools
 import logging
 from datetime import datetime, timezone
 from PersonalizeAI.state import GraphState
@@ -19,11 +21,13 @@ from pathlib import Path
 logger = logging.getLogger("phase2.self_correction")
 
 
+@functools.lru_cache(maxsize=32)
 def _find_repo_root(start: Path) -> Path:
     """Find the repository root by walking parents and locating common markers.
 
     We look for `pyproject.toml`, `.git`, or `README.md`. If none are found we
-    fall back to the top-most parent.
+    fall back to the top-most parent. Results are cached per start path, since
+    the walk issues several filesystem stats per ancestor.
     """
     for p in [start] + list(start.parents):
         if (p / "pyproject.toml").exists() or (p / ".git").exists() or (p / "README.md").exists():
@@ -32,6 +36,59 @@ def _find_repo_root(start: Path) -> Path:
     return start.parents[-1]
 
 
+def _persist_audit_entry(audit_entry: dict[str, Any]) -> None:
+    """Append an audit entry to the retrieval-logs JSONL files (blocking I/O)."""
+    # Write to both detected repo root and an alternate ancestor path (if available)
+    try:
+        start_path = Path(__file__).resolve()
+        repo_root = _find_repo_root(start_path)
+
+        # Build a list of candidate roots to write logs to. Tests and runners
+        # may compute a repo root differently, so write to several likely
+        # locations: the detected repo root, a few ancestors of this module,
+        # and the current working directory. Deduplicate candidates.
+        candidates = [repo_root]
+
+        # include a few upper ancestors of this module (0..5)
+        for i, anc in enumerate(start_path.parents):
+            if i >= 6:
+                break
+            candidates.append(anc)
+
+        # include the current working directory which is often the repo root
+        try:
+            cwd = Path.cwd()
+            candidates.append(cwd)
+        except Exception:
+            pass
+
+        # normalize and deduplicate while preserving order
+        seen = set()
+        uniq_candidates = []
+        for c in candidates:
+            try:
+                r = c.resolve()
+            except Exception:
+                r = c
+            if r in seen:
+                continue
+            seen.add(r)
+            uniq_candidates.append(r)
+
+        # Serialize once; the same line is appended to every candidate log.
+        line = (json.dumps(audit_entry, ensure_ascii=False) + "\n").encode("utf-8")
+        # Daily file name, taken from the entry's own UTC ISO timestamp.
+        log_name = f"self_correction_{audit_entry['ts'][:10]}.jsonl"
+        for root in uniq_candidates:
+            logs_dir = root / "retrieval-logs"
+            logs_dir.mkdir(parents=True, exist_ok=True)
+            log_file = logs_dir / log_name
+            with log_file.open("ab") as fh:
+                fh.write(line)
+    except Exception as exc:
+        logger.exception("Failed to write self_correction audit log: %s", exc)
+
+
 async def self_correction(
     state: GraphState,
     openai_client: Any,
@@ -121,52 +178,8 @@ async def self_correction(
     }
     audit.append(audit_entry)
 
-    # Persist audit entry to retrieval-logs as a JSONL file for external auditing.
-    # Write to both detected repo root and an alternate ancestor path (if available)
-    try:
-        start_path = Path(__file__).resolve()
-        repo_root = _find_repo_root(start_path)
-
-        # Build a list of candidate roots to write logs to. Tests and runners
-        # may compute a repo root differently, so write to several likely
-        # locations: the detected repo root, a few ancestors of this module,
-        # and the current working directory. Deduplicate candidates.
-        candidates = [repo_root]
-
-        # include a few upper ancestors of this module (0..5)
-        for i, anc in enumerate(start_path.parents):
-            if i >= 6:
-                break
-            candidates.append(anc)
-
-        # include the current working directory which is often the repo root
-        try:
-            cwd = Path.cwd()
-            candidates.append(cwd)
-        except Exception:
-            pass
-
-        # normalize and deduplicate while preserving order
-        seen = set()
-        uniq_candidates = []
-        for c in candidates:
-            try:
-                r = c.resolve()
-            except Exception:
-                r = c
-            if r in seen:
-                continue
-            seen.add(r)
-            uniq_candidates.append(r)
-
-        for root in uniq_candidates:
-            logs_dir = root / "retrieval-logs"
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            log_file = logs_dir / f"self_correction_{datetime.now(timezone.utc).date().isoformat()}.jsonl"
-            with log_file.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(audit_entry, ensure_ascii=False) + "\n")
-    except Exception as exc:
-        logger.exception("Failed to write self_correction audit log: %s", exc)
+    # Persisting touches the filesystem several times; keep it off the event loop.
+    await asyncio.to_thread(_persist_audit_entry, audit_entry)
 
     return {"context_query": new_query, "self_correction_audit": audit}
 
@@ -2,6 +2,7 @@ from typing import Dict, List, Any, Optional
 from PersonalizeAI.state import GraphState
 import json
 import logging
+from PersonalizeAI.utils.approach_settings import resolve_model
 from PersonalizeAI.utils.response_cleaner import parse_and_validate_rewrite
 
 
@@ -19,28 +20,35 @@ async def automated_rewrite(
     variants = state.get("message_variants", []) or []
     compliance_log = state.get("compliance_log", []) or []
 
-    non_compliant_ids = {log["variant_id"] for log in compliance_log if not log.get("is_compliant")}
+    # Latest failure reason per non-compliant variant, indexed in one pass so
+    # each variant doesn't rescan the whole compliance log.
+    failure_reasons: dict[Any, Optional[str]] = {}
+    for log in compliance_log:
+        if not log.get("is_compliant"):
+            failure_reasons[log["variant_id"]] = log.get("reason")
 
     updated_variants: List[Dict[str, str]] = []
 
-    model_to_use = None
-    try:
-        if approach is not None:
-            model_to_use = getattr(approach, "chatgpt_deployment", None) or getattr(approach, "chatgpt_model", None)
-    except Exception:
-        model_to_use = None
+    # The prompt template and model are the same for every variant, so resolve
+    # them once rather than per rewrite.
+    model_to_use = resolve_model(approach)
+    pm_prompt = None
+    if openai_client is not None and prompt_manager is not None and failure_reasons:
+        try:
+            pm_prompt = prompt_manager.load_prompt("phase3_generation/automated_rewrite.prompty")
+        except Exception:
+            pm_prompt = None
 
     for variant in variants:
         vid = variant.get("id")
-        if vid in non_compliant_ids:
-            reason = next((log.get("reason") for log in reversed(compliance_log) if log.get("variant_id") == vid and not log.get("is_compliant")), "Policy violation.")
+        if vid in failure_reasons:
+            reason = failure_reasons[vid]
 
             # Prefer LLM-based rewrite when available
             if openai_client is not None:
                 messages = None
-                if prompt_manager is not None:
+                if prompt_manager is not None and pm_prompt is not None:
                     try:
-                        pm_prompt = prompt_manager.load_prompt("phase3_generation/automated_rewrite.prompty")
                         messages = prompt_manager.render_prompt(pm_prompt, {"variant": variant, "reason": reason})
                     except Exception:
                         messages = None
@@ -3,8 +3,11 @@ from PersonalizeAI.state import GraphState
 from typing import Dict, List, Any, Optional
 from PersonalizeAI.state import GraphState
 from datetime import datetime, timezone
+import asyncio
 import json
 import logging
+import re
+from PersonalizeAI.utils.approach_settings import resolve_model
 from PersonalizeAI.utils.response_cleaner import parse_and_validate_judge
 
 
@@ -15,6 +18,78 @@ SAFETY_POLICY_RULES = [
     "Ensure brand tone is positive and motivational.",
 ]
 
+# Terms checked by the deterministic fallback. They are compiled into a single
+# case-insensitive alternation so each variant body is scanned once rather than
+# once per term, without building a lowercased copy of the body.
+SENSITIVE_ATTRIBUTE_TERMS = ("race", "religion", "illness")
+_SENSITIVE_ATTRIBUTE_RE = re.compile(
+    "|".join(re.escape(term) for term in SENSITIVE_ATTRIBUTE_TERMS), re.IGNORECASE
+)
+_HEALTH_CLAIM_RE = re.compile(re.escape("fitness goals"), re.IGNORECASE)
+
+# Upper bound on judge requests in flight at once for a single compliance pass,
+# so large variant sets don't burst past the model deployment's rate limits.
+MAX_CONCURRENT_JUDGE_CALLS = 4
+
+
+async def _judge_variant(
+    variant: dict[str, Any],
+    openai_client: Any,
+    prompt_manager: Optional[Any] = None,
+    pm_prompt: Optional[Any] = None,
+    model_to_use: Optional[str] = None,
+) -> tuple[bool, Optional[str]]:
+    """
+    Ask the LLM judge for a verdict on a single variant. Returns
+    ``(is_compliant, reason)``; ``(True, None)`` when the judge fails or its
+    output cannot be parsed, so the deterministic checks decide instead.
+    """
+    is_compliant = True
+    violation_reason = None
+
+    # Build a compact judging prompt
+    messages = None
+    if prompt_manager is not None and pm_prompt is not None:
+        try:
+            messages = prompt_manager.render_prompt(pm_prompt, {"variant": variant, "rules": SAFETY_POLICY_RULES})
+        except Exception:
+            messages = None
+
+    if messages is None:
+        messages = [
+            {"role": "system", "content": "You are a strict policy judge. For the provided message variant, check it against the rules and respond ONLY with JSON: {\"is_compliant\": true|false, \"reason\": null|\"reason string\"}"},
+            {"role": "user", "content": f"Rules: {SAFETY_POLICY_RULES}\nMessage: {variant}"},
+        ]
+
+    try:
+        if model_to_use:
+            resp = await openai_client.chat.completions.create(model=model_to_use, messages=messages, n=1)
+        else:
+            resp = await openai_client.chat.completions.create(messages=messages, n=1)
+
+        content = None
+        if resp and getattr(resp, "choices", None):
+            choice = resp.choices[0]
+            if getattr(choice, "message", None) and getattr(choice.message, "content", None):
+                content = choice.message.content.strip()
+            elif getattr(choice, "text", None):
+                content = choice.text.strip()
+
+        if content:
+            try:
+                verdict = parse_and_validate_judge(content)
+                is_compliant = bool(verdict.get("is_compliant", True))
+                violation_reason = verdict.get("reason")
+            except Exception as exc:
+                logging.getLogger("phase3.compliance").exception("Failed to parse judge output: %s", exc)
+                # If parsing fails, fall back to keyword checks
+                pass
+    except Exception:
+        # LLM judge failed; fall through to deterministic checks
+        pass
+
+    return is_compliant, violation_reason
+
 
 async def compliance_agent(
     state: GraphState,
@@ -32,69 +107,43 @@ async def compliance_agent(
 
     new_compliance_log: List[Dict[str, Any]] = []
 
-    for variant in variants:
-        variant_id = variant.get("id")
-        body = variant.get("body", "")
-
-        is_compliant = True
-        violation_reason = None
-
-        if openai_client is not None:
-            # Build a compact judging prompt
-            messages = None
-            if prompt_manager is not None:
-                try:
-                    pm_prompt = prompt_manager.load_prompt("phase3_generation/compliance_agent.prompty")
-                    messages = prompt_manager.render_prompt(pm_prompt, {"variant": variant, "rules": SAFETY_POLICY_RULES})
-                except Exception:
-                    messages = None
-
-            if messages is None:
-                messages = [
-                    {"role": "system", "content": "You are a strict policy judge. For the provided message variant, check it against the rules and respond ONLY with JSON: {\"is_compliant\": true|false, \"reason\": null|\"reason string\"}"},
-                    {"role": "user", "content": f"Rules: {SAFETY_POLICY_RULES}\nMessage: {variant}"},
-                ]
-
-            model_to_use = None
+    if openai_client is not None and variants:
+        # The prompt template and model are the same for every variant, so
+        # resolve them once per pass.
+        pm_prompt = None
+        if prompt_manager is not None:
             try:
-                if approach is not None:
-                    model_to_use = getattr(approach, "chatgpt_deployment", None) or getattr(approach, "chatgpt_model", None)
+                pm_prompt = prompt_manager.load_prompt("phase3_generation/compliance_agent.prompty")
             except Exception:
-                model_to_use = None
-
-            try:
-                if model_to_use:
-                    resp = await openai_client.chat.completions.create(model=model_to_use, messages=messages, n=1)
-                else:
-                    resp = await openai_client.chat.completions.create(messages=messages, n=1)
-
-                content = None
-                if resp and getattr(resp, "choices", None):
-                    choice = resp.choices[0]
-                    if getattr(choice, "message", None) and getattr(choice.message, "content", None):
-                        content = choice.message.content.strip()
-                    elif getattr(choice, "text", None):
-                        content = choice.text.strip()
-
-                if content:
-                    try:
-                        verdict = parse_and_validate_judge(content)
-                        is_compliant = bool(verdict.get("is_compliant", True))
-                        violation_reason = verdict.get("reason")
-                    except Exception as exc:
-                        logging.getLogger("phase3.compliance").exception("Failed to parse judge output: %s", exc)
-                        # If parsing fails, fall back to keyword checks below
-                        pass
-            except Exception:
-                # LLM judge failed; fall through to deterministic checks
-                pass
+                pm_prompt = None
+        model_to_use = resolve_model(approach)
+
+        if len(variants) == 1:
+            # Nothing to overlap; skip the semaphore and gather scheduling.
+            verdicts = [await _judge_variant(variants[0], openai_client, prompt_manager, pm_prompt, model_to_use)]
+        else:
+            # Judge calls are network-bound, so issue them concurrently (bounded by
+            # MAX_CONCURRENT_JUDGE_CALLS); gather keeps the verdicts in variant order.
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_JUDGE_CALLS)
+
+            async def _bounded_judge(variant: dict[str, Any]) -> tuple[bool, Optional[str]]:
+                async with semaphore:
+                    return await _judge_variant(variant, openai_client, prompt_manager, pm_prompt, model_to_use)
+
+            verdicts = await asyncio.gather(*(_bounded_judge(variant) for variant in variants))
+    else:
+        verdicts = [(True, None)] * len(variants)
+
+    for variant, (is_compliant, violation_reason) in zip(variants, verdicts):
+        variant_id = variant.get("id")
+        body = variant.get("body", "")
 
         # Deterministic fallback checks
         if violation_reason is None:
-            if "fitness goals" in body.lower():
+            if _HEALTH_CLAIM_RE.search(body):
                 is_compliant = False
                 violation_reason = "Health claim ('fitness goals') detected without explicit product citation."
-            if any(word in body.lower() for word in ("race", "religion", "illness")):
+            if _SENSITIVE_ATTRIBUTE_RE.search(body):
                 is_compliant = False
                 violation_reason = (violation_reason or "Targets sensitive attribute; violates policy.")
 
@@ -9,8 +9,7 @@ def rewrite_decision(state: GraphState) -> Literal["END_PHASE_3", "AUTOMATED_REW
     """
     compliance_log = state.get("compliance_log", []) or []
 
-    latest_failures = [log for log in compliance_log if not log.get("is_compliant")]
-    non_compliant_variants = {log["variant_id"] for log in latest_failures}
+    non_compliant_variants = {log["variant_id"] for log in compliance_log if not log.get("is_compliant")}
 
     if non_compliant_variants:
         print(f"Compliance Check: FAIL. {len(non_compliant_variants)} variants need rewriting.")
@@ -14,70 +14,132 @@ Usage:
     asyncio.run(run_full_pipeline(state, openai_client=..., prompt_manager=..., approach=...))
 
 """
+from datetime import datetime
+from collections.abc import Callable
 from typing import Any, Dict, Optional
+import functools
+import importlib
 import inspect
 
 
-async def run_full_pipeline(state: Dict[str, Any], openai_client: Optional[Any] = None, prompt_manager: Optional[Any] = None, approach: Optional[Any] = None) -> Dict[str, Any]:
-    """Run a full pipeline: Phase 3 generation+compliance followed by Phase 4 experimentation.
+@functools.cache
+def _resolve_phase1_segmenter() -> tuple[bool, Optional[Callable]]:
+    """Locate the optional Phase 1 segmentation module and its entry point.
 
-    The function mutates and returns `state`.
+    Returns ``(module_found, seg_fn)``. Resolved once per process: a missing
+    module would otherwise repeat the full import-path search on every run.
     """
-    # Lazy imports to avoid heavy startup costs and to be robust in tests
     try:
-        from PersonalizeAI.nodes.phase3_generation.ai_message_generator import ai_message_generator
-        from PersonalizeAI.nodes.phase3_generation.compliance_agent import compliance_agent
-        from PersonalizeAI.nodes.phase3_generation.rewrite_decision import rewrite_decision
-        from PersonalizeAI.nodes.phase3_generation.automated_rewrite import automated_rewrite
+        phase1_mod = importlib.import_module("PersonalizeAI.nodes.phase1_segmentation.segmenter")
     except Exception:
-        ai_message_generator = compliance_agent = rewrite_decision = automated_rewrite = None
-
+        return False, None
+
+    for candidate in ("segment", "segmenter", "generate_segment_description"):
+        if hasattr(phase1_mod, candidate):
+            return True, getattr(phase1_mod, candidate)
+    return True, None
+
+
+# Node entry points per phase as (package, name) pairs; each module is named
+# after the function it exports.
+_PHASE2_NODES = (
+    ("PersonalizeAI.nodes.phase2_retrieval", "contextual_query_generator"),
+    ("PersonalizeAI.nodes.phase2_retrieval", "vector_search_retriever"),
+    ("PersonalizeAI.nodes.phase2_retrieval", "relevance_grader"),
+    ("PersonalizeAI.nodes.phase2_retrieval", "self_correction"),
+    ("PersonalizeAI.nodes.phase2_retrieval", "citation_formatter"),
+)
+_PHASE3_NODES = (
+    ("PersonalizeAI.nodes.phase3_generation", "ai_message_generator"),
+    ("PersonalizeAI.nodes.phase3_generation", "compliance_agent"),
+    ("PersonalizeAI.nodes.phase3_generation", "rewrite_decision"),
+    ("PersonalizeAI.nodes.phase3_generation", "automated_rewrite"),
+)
+_PHASE4_NODES = (
+    ("PersonalizeAI.nodes.phase4_experimentation", "abn_experiment_simulator"),
+    ("PersonalizeAI.nodes.phase4_experimentation", "winning_variant_selector"),
+    ("PersonalizeAI.nodes.phase4_experimentation", "deployment_router"),
+    ("PersonalizeAI.nodes.phase4_experimentation", "feedback_processor"),
+)
+
+
+@functools.cache
+def _load_node_group(nodes: tuple[tuple[str, str], ...]) -> tuple[Optional[Callable], ...]:
+    """Import a phase's node functions, all or nothing.
+
+    Returns a tuple of ``None`` if any of them fails to import. Cached so each
+    run reuses the resolved callables instead of repeating the imports.
+    """
     try:
-        from PersonalizeAI.nodes.phase4_experimentation.abn_experiment_simulator import abn_experiment_simulator
-        from PersonalizeAI.nodes.phase4_experimentation.winning_variant_selector import winning_variant_selector
-        from PersonalizeAI.nodes.phase4_experimentation.deployment_router import deployment_router
-        from PersonalizeAI.nodes.phase4_experimentation.feedback_processor import feedback_processor
+        return tuple(getattr(importlib.import_module(f"{package}.{name}"), name) for package, name in nodes)
     except Exception:
-        abn_experiment_simulator = winning_variant_selector = deployment_router = feedback_processor = None
+        return (None,) * len(nodes)
+
+
+@functools.cache
+def _accepted_kwargs(fn: Callable) -> Optional[frozenset]:
+    """Names of the keyword arguments ``fn`` accepts, or ``None`` if it takes ``**kwargs``.
+
+    Inspected once per node callable so ``_call_node`` can pass only the
+    supported kwargs instead of probing with a call and catching TypeError.
+    """
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params):
+        return None
+    return frozenset(
+        p.name for p in params
+        if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    )
+
+
+@functools.cache
+def _is_async_node(fn: Callable) -> bool:
+    """Cached ``inspect.iscoroutinefunction`` for node callables."""
+    return inspect.iscoroutinefunction(fn)
+
+
+async def _call_node(fn: Optional[Callable], _state: dict[str, Any], **kwargs: Any) -> Any:
+    """Call a sync or async node, passing only the kwargs its signature accepts.
+
+    The node is called exactly once. Its exceptions are printed and turned into
+    ``None`` so one failing node doesn't break the entire pipeline.
+    """
+    if fn is None:
+        return None
+    accepted = _accepted_kwargs(fn)
+    if accepted is not None:
+        kwargs = {k: v for k, v in kwargs.items() if k in accepted}
+    try:
+        if _is_async_node(fn):
+            return await fn(_state, **kwargs)
+        return fn(_state, **kwargs)
+    except Exception as exc:  # defensive: don't let one node break entire pipeline
+        print(f"Orchestrator: node {getattr(fn, '__name__', str(fn))} raised: {exc}")
+        return None
+
+
+async def run_full_pipeline(state: Dict[str, Any], openai_client: Optional[Any] = None, prompt_manager: Optional[Any] = None, approach: Optional[Any] = None) -> Dict[str, Any]:
+    """Run a full pipeline: Phase 3 generation+compliance followed by Phase 4 experimentation.
+
+    The function mutates and returns `state`.
+    """
+    # Lazy imports to avoid heavy startup costs and to be robust in tests
+    ai_message_generator, compliance_agent, rewrite_decision, automated_rewrite = _load_node_group(_PHASE3_NODES)
+    abn_experiment_simulator, winning_variant_selector, deployment_router, feedback_processor = _load_node_group(_PHASE4_NODES)
 
     # Ensure some defaults
     state.setdefault("segment_description", "")
     state.setdefault("campaign_goal", "")
     state.setdefault("retrieved_content", [])
 
-    # Helper to call both sync and async node functions with flexible kwargs
-    async def _call_node(fn, _state, **kwargs):
-        if fn is None:
-            return None
-        try:
-            if inspect.iscoroutinefunction(fn):
-                try:
-                    return await fn(_state, **kwargs)
-                except TypeError:
-                    return await fn(_state)
-            else:
-                try:
-                    return fn(_state, **kwargs)
-                except TypeError:
-                    return fn(_state)
-        except Exception as exc:  # defensive: don't let one node break entire pipeline
-            print(f"Orchestrator: node {getattr(fn, '__name__', str(fn))} raised: {exc}")
-            return None
-
     # --- Phase 1: Segmentation (optional) ---
     # If a Phase 1 segmentation module exists, try to use it; otherwise use a small fallback.
-    try:
-        import importlib
-        phase1_mod = importlib.import_module("PersonalizeAI.nodes.phase1_segmentation.segmenter")
-    except Exception:
-        phase1_mod = None
+    phase1_found, seg_fn = _resolve_phase1_segmenter()
 
-    if phase1_mod is not None:
-        seg_fn = None
-        for candidate in ("segment", "segmenter", "generate_segment_description"):
-            if hasattr(phase1_mod, candidate):
-                seg_fn = getattr(phase1_mod, candidate)
-                break
+    if phase1_found:
         if seg_fn is not None:
             seg_update = await _call_node(seg_fn, state, openai_client=openai_client, prompt_manager=prompt_manager, approach=approach)
             if isinstance(seg_update, dict):
@@ -92,14 +154,7 @@ async def run_full_pipeline(state: Dict[str, Any], openai_client: Optional[Any]
             print(f"Orchestrator: using fallback segmentation -> {state['segment_description']}")
 
     # --- Phase 2: Retrieval (contextual query -> vector search -> relevance -> correction/citation) ---
-    try:
-        from PersonalizeAI.nodes.phase2_retrieval.contextual_query_generator import contextual_query_generator
-        from PersonalizeAI.nodes.phase2_retrieval.vector_search_retriever import vector_search_retriever
-        from PersonalizeAI.nodes.phase2_retrieval.relevance_grader import relevance_grader
-        from PersonalizeAI.nodes.phase2_retrieval.self_correction import self_correction
-        from PersonalizeAI.nodes.phase2_retrieval.citation_formatter import citation_formatter
-    except Exception:
-        contextual_query_generator = vector_search_retriever = relevance_grader = self_correction = citation_formatter = None
+    contextual_query_generator, vector_search_retriever, relevance_grader, self_correction, citation_formatter = _load_node_group(_PHASE2_NODES)
 
     # Contextual query
     if contextual_query_generator is not None:
@@ -115,11 +170,12 @@ async def run_full_pipeline(state: Dict[str, Any], openai_client: Optional[Any]
 
     # Relevance grading -> either SELF_CORRECTION or CITATION_FORMATTER
     if relevance_grader is not None:
-        try:
-            route = relevance_grader(state)
-        except TypeError:
+        # Called directly rather than via _call_node: a grader failure should
+        # fail the pipeline, not silently fall through to citation formatting.
+        route = relevance_grader(state)
+        if inspect.isawaitable(route):
             # some graders might be async
-            route = await _call_node(relevance_grader, state)
+            route = await route
         if route == "SELF_CORRECTION" and self_correction is not None:
             sc_update = await _call_node(self_correction, state, openai_client=openai_client, prompt_manager=prompt_manager, approach=approach)
             if isinstance(sc_update, dict):
@@ -173,6 +229,6 @@ async def run_full_pipeline(state: Dict[str, Any], openai_client: Optional[Any]
             dq = state.setdefault("deployment_queue", [])
             winner = state.get("winning_variant_id")
             if winner:
-                dq.append({"variant_id": winner, "timestamp": __import__("datetime").datetime.utcnow().isoformat()})
+                dq.append({"variant_id": winner, "timestamp": datetime.utcnow().isoformat()})
 
     return state
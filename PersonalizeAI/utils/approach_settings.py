@@ -0,0 +1,14 @@
+"""Helpers for reading settings off the backend approach passed to PersonalizeAI nodes."""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+
+def resolve_model(approach: Optional[Any]) -> Optional[str]:
+    """Deployment (or model) name to pass to chat completions, if the approach has one."""
+    try:
+        if approach is not None:
+            return getattr(approach, "chatgpt_deployment", None) or getattr(approach, "chatgpt_model", None)
+    except Exception:
+        pass
+    return None
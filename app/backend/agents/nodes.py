@@ -1,5 +1,4 @@
 # app/agents/nodes.py
-from langchain_core.messages import HumanMessage
 
 async def segmentation_node(state):
     # Logic to call LLM and segment customers
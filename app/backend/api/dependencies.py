@@ -4,12 +4,8 @@ from typing import Any
 
 from fastapi import HTTPException, Request
 
-from config import CONFIG_AUTH_CLIENT, CONFIG_SEARCH_CLIENT
+from config import CONFIG_ASK_APPROACH, CONFIG_AUTH_CLIENT, CONFIG_CHAT_APPROACH, CONFIG_SEARCH_CLIENT
 from core.authentication import AuthError
-from typing import Any
-from fastapi import HTTPException, Request, Depends
-
-from config import CONFIG_ASK_APPROACH, CONFIG_CHAT_APPROACH
 
 
 async def get_ask_approach(request: Request) -> Any:
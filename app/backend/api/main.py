@@ -3,17 +3,23 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 # from fastapi.staticfiles import StaticFiles
 from .routes import router as api_router
+from .routes.utils import ORJSONResponse
 from .startup import register as register_startup
 
+# Origins allowed by CORS. A frozenset keeps the per-request origin check a
+# hash lookup. Update with your frontend URL.
+ALLOWED_ORIGINS = frozenset({"http://localhost:8082"})
+
 app = FastAPI(
     title="EchoVoice AI Orchestrator",
     description="Backend API for Multi-Agent Marketing Personalization",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:8082"],  # Update with your frontend URL
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class Message(BaseModel):
@@ -8,13 +8,15 @@ class Message(BaseModel):
     content: str
 
 
+# Module-level adapter so message lists are dumped with one prebuilt serializer
+MESSAGES_ADAPTER = TypeAdapter(List[Message])
+
+
 class AskRequest(BaseModel):
     messages: List[Message]
     context: Optional[Dict[str, Any]] = None
     session_state: Optional[Any] = None
 
 
-class ChatRequest(BaseModel):
-    messages: List[Message]
-    context: Optional[Dict[str, Any]] = None
-    session_state: Optional[Any] = None
+class ChatRequest(AskRequest):
+    """/chat and /chat/stream take the same body as /ask."""
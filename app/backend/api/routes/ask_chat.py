@@ -1,9 +1,9 @@
 """Ask and chat endpoints (including NDJSON streaming) using Pydantic models and DI."""
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 
-from ..models import AskRequest, ChatRequest
-from .utils import ndjson_bytes
+from ..models import MESSAGES_ADAPTER, AskRequest, ChatRequest
+from .utils import ORJSONResponse, ndjson_bytes
 from ..dependencies import get_auth_claims, get_ask_approach, get_chat_approach
 from config import CONFIG_CHAT_HISTORY_BROWSER_ENABLED, CONFIG_CHAT_HISTORY_COSMOS_ENABLED
 
@@ -19,10 +19,10 @@ async def ask(
     context = body.context or {}
     context["auth_claims"] = auth_claims
     try:
-        r = await approach.run([m.dict() for m in body.messages], context=context, session_state=body.session_state)
-        return JSONResponse(r)
+        r = await approach.run(MESSAGES_ADAPTER.dump_python(body.messages), context=context, session_state=body.session_state)
+        return ORJSONResponse(r)
     except Exception as error:
-        return JSONResponse({"error": str(error)}, status_code=500)
+        return ORJSONResponse({"error": str(error)}, status_code=500)
 
 
 @router.post("/chat/stream")
@@ -45,10 +45,10 @@ async def chat_stream(
                 cfg.get(CONFIG_CHAT_HISTORY_BROWSER_ENABLED),
             )
 
-        result_gen = await approach.run_stream([m.dict() for m in body.messages], context=context, session_state=session_state)
+        result_gen = await approach.run_stream(MESSAGES_ADAPTER.dump_python(body.messages), context=context, session_state=session_state)
         return StreamingResponse(ndjson_bytes(result_gen), media_type="application/x-ndjson")
     except Exception as error:
-        return JSONResponse({"error": str(error)}, status_code=500)
+        return ORJSONResponse({"error": str(error)}, status_code=500)
 
 
 @router.post("/chat")
@@ -71,7 +71,7 @@ async def chat(
                 cfg.get(CONFIG_CHAT_HISTORY_BROWSER_ENABLED),
             )
 
-        result = await approach.run([m.dict() for m in body.messages], context=context, session_state=session_state)
-        return JSONResponse(result)
+        result = await approach.run(MESSAGES_ADAPTER.dump_python(body.messages), context=context, session_state=session_state)
+        return ORJSONResponse(result)
     except Exception as error:
-        return JSONResponse({"error": str(error)}, status_code=500)
+        return ORJSONResponse({"error": str(error)}, status_code=500)
@@ -1,9 +1,10 @@
 """Authentication setup endpoint."""
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
 
 from config import CONFIG_AUTH_CLIENT
 
+from .utils import ORJSONResponse
+
 router = APIRouter()
 
 
@@ -18,4 +19,4 @@ async def auth_setup(request: Request):
         raise HTTPException(status_code=503, detail="Auth client not configured")
 
     setup_info = auth_client.get_auth_setup_for_client()
-    return JSONResponse(setup_info)
+    return ORJSONResponse(setup_info)
@@ -1,7 +1,7 @@
 """Chat history endpoints backed by Cosmos (optional)."""
 import time
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
 
 from config import (
     CONFIG_CHAT_HISTORY_COSMOS_ENABLED,
@@ -11,6 +11,7 @@ from config import (
     CONFIG_CREDENTIAL,
 )
 from ..dependencies import get_auth_claims
+from .utils import ORJSONResponse
 
 router = APIRouter()
 
@@ -22,15 +23,15 @@ async def post_chat_history(request: Request, auth_claims: dict = Depends(get_au
         raise HTTPException(status_code=503, detail="App not initialized")
 
     if not cfg.get(CONFIG_CHAT_HISTORY_COSMOS_ENABLED):
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
 
     container = cfg.get(CONFIG_COSMOS_HISTORY_CONTAINER)
     if not container:
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
 
     entra_oid = auth_claims.get("oid")
     if not entra_oid:
-        return JSONResponse({"error": "User OID not found"}, status_code=401)
+        return ORJSONResponse({"error": "User OID not found"}, status_code=401)
 
     try:
         request_json = await request.json()
@@ -68,9 +69,9 @@ async def post_chat_history(request: Request, auth_claims: dict = Depends(get_au
             ("upsert", (message_pair_item,)) for message_pair_item in message_pair_items
         ]
         await container.execute_item_batch(batch_operations=batch_operations, partition_key=[entra_oid, session_id])
-        return JSONResponse({}, status_code=201)
+        return ORJSONResponse({}, status_code=201)
     except Exception as error:
-        return JSONResponse({"error": str(error)}, status_code=500)
+        return ORJSONResponse({"error": str(error)}, status_code=500)
 
 
 @router.get("/chat_history/sessions",tags=["ChatHistory"])
@@ -79,13 +80,13 @@ async def get_chat_history_sessions(request: Request, auth_claims: dict = Depend
     if cfg is None:
         raise HTTPException(status_code=503, detail="App not initialized")
     if not cfg.get(CONFIG_CHAT_HISTORY_COSMOS_ENABLED):
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
     container = cfg.get(CONFIG_COSMOS_HISTORY_CONTAINER)
     if not container:
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
     entra_oid = auth_claims.get("oid")
     if not entra_oid:
-        return JSONResponse({"error": "User OID not found"}, status_code=401)
+        return ORJSONResponse({"error": "User OID not found"}, status_code=401)
 
     try:
         count = int(request.query_params.get("count", 10))
@@ -113,9 +114,9 @@ async def get_chat_history_sessions(request: Request, auth_claims: dict = Depend
         except StopAsyncIteration:
             continuation_token = None
 
-        return JSONResponse({"sessions": sessions, "continuation_token": continuation_token})
+        return ORJSONResponse({"sessions": sessions, "continuation_token": continuation_token})
     except Exception as error:
-        return JSONResponse({"error": str(error)}, status_code=500)
+        return ORJSONResponse({"error": str(error)}, status_code=500)
 
 
 @router.get("/chat_history/sessions/{session_id}",tags=["ChatHistory"])
@@ -124,13 +125,13 @@ async def get_chat_history_session(request: Request, session_id: str, auth_claim
     if cfg is None:
         raise HTTPException(status_code=503, detail="App not initialized")
     if not cfg.get(CONFIG_CHAT_HISTORY_COSMOS_ENABLED):
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
     container = cfg.get(CONFIG_COSMOS_HISTORY_CONTAINER)
     if not container:
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
     entra_oid = auth_claims.get("oid")
     if not entra_oid:
-        return JSONResponse({"error": "User OID not found"}, status_code=401)
+        return ORJSONResponse({"error": "User OID not found"}, status_code=401)
 
     try:
         res = container.query_items(
@@ -144,9 +145,9 @@ async def get_chat_history_session(request: Request, session_id: str, auth_claim
             async for item in page:
                 message_pairs.append([item["question"], item["response"]])
 
-        return JSONResponse({"id": session_id, "entra_oid": entra_oid, "answers": message_pairs})
+        return ORJSONResponse({"id": session_id, "entra_oid": entra_oid, "answers": message_pairs})
     except Exception as error:
-        return JSONResponse({"error": str(error)}, status_code=500)
+        return ORJSONResponse({"error": str(error)}, status_code=500)
 
 
 @router.delete("/chat_history/sessions/{session_id}",tags=["ChatHistory"])
@@ -155,13 +156,13 @@ async def delete_chat_history_session(request: Request, session_id: str, auth_cl
     if cfg is None:
         raise HTTPException(status_code=503, detail="App not initialized")
     if not cfg.get(CONFIG_CHAT_HISTORY_COSMOS_ENABLED):
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
     container = cfg.get(CONFIG_COSMOS_HISTORY_CONTAINER)
     if not container:
-        return JSONResponse({"error": "Chat history not enabled"}, status_code=400)
+        return ORJSONResponse({"error": "Chat history not enabled"}, status_code=400)
     entra_oid = auth_claims.get("oid")
     if not entra_oid:
-        return JSONResponse({"error": "User OID not found"}, status_code=401)
+        return ORJSONResponse({"error": "User OID not found"}, status_code=401)
 
     try:
         res = container.query_items(
@@ -179,4 +180,4 @@ async def delete_chat_history_session(request: Request, session_id: str, auth_cl
         await container.execute_item_batch(batch_operations=batch_operations, partition_key=[entra_oid, session_id])
         return Response(status_code=204)
     except Exception as error:
-        return JSONResponse({"error": str(error)}, status_code=500)
+        return ORJSONResponse({"error": str(error)}, status_code=500)
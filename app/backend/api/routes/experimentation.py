@@ -0,0 +1,4 @@
+"""Experimentation routes (A/B test setup). No endpoints are served yet."""
+from fastapi import APIRouter
+
+router = APIRouter()
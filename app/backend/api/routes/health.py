@@ -1,6 +1,9 @@
 """Health and config endpoints."""
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+import hashlib
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from config import (
     CONFIG_AGENTIC_KNOWLEDGEBASE_ENABLED,
@@ -25,25 +28,30 @@ from config import (
     CONFIG_VECTOR_SEARCH_ENABLED,
     CONFIG_WEB_SOURCE_ENABLED,
     CONFIG_SHAREPOINT_SOURCE_ENABLED,
-    CONFIG_ECHOVOICE_SEARCH_IMAGE_EMBEDDINGS,
-    CONFIG_ECHOVOICE_SEND_TEXT_SOURCES,
 )
 
+from .utils import ORJSONResponse
+
 router = APIRouter()
 
 
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag`` (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
 @router.get("/health",tags=["Health"])
 async def health():
-    return JSONResponse({"status": "ok"})
+    return ORJSONResponse({"status": "ok"})
 
 
-@router.get("/config",tags=["Health"])
-async def config(request: Request):
-    cfg = getattr(request.app.state, "config", None)
-    if cfg is None:
-        raise HTTPException(status_code=503, detail="App not initialized")
-
-    return JSONResponse({
+def config_payload(cfg: dict) -> dict:
+    return {
         "showMultimodalOptions": cfg.get(CONFIG_MULTIMODAL_ENABLED),
         "showSemanticRankerOption": cfg.get(CONFIG_SEMANTIC_RANKER_DEPLOYED),
         "showQueryRewritingOption": cfg.get(CONFIG_QUERY_REWRITING_ENABLED),
@@ -70,4 +78,25 @@ async def config(request: Request):
         "ragSendImageSources": cfg.get(CONFIG_ECHOVOICE_SEND_IMAGE_SOURCES),
         "webSourceEnabled": cfg.get(CONFIG_WEB_SOURCE_ENABLED),
         "sharepointSourceEnabled": cfg.get(CONFIG_SHAREPOINT_SOURCE_ENABLED),
-    })
+    }
+
+
+@router.get("/config",tags=["Health"])
+async def config(request: Request):
+    cfg = getattr(request.app.state, "config", None)
+    if cfg is None:
+        raise HTTPException(status_code=503, detail="App not initialized")
+
+    # Feature flags are fixed once startup completes, so render the body once
+    # and let clients revalidate with If-None-Match. The cache remembers which
+    # config mapping it was built from, so it resets when setup_clients runs again.
+    cached = getattr(request.app.state, "config_response", None)
+    if cached is None or cached[0] is not cfg:
+        body = orjson.dumps(config_payload(cfg))
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = request.app.state.config_response = (cfg, body, etag)
+    _, body, etag = cached
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
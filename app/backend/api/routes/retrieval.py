@@ -2,7 +2,9 @@ from fastapi import APIRouter, Request
 from pydantic import BaseModel
 from typing import Any, Dict
 
-from backend.config import CONFIG_ASK_APPROACH, CONFIG_SEARCH_CLIENT, CONFIG_OPENAI_CLIENT
+from config import CONFIG_ASK_APPROACH, CONFIG_SEARCH_CLIENT, CONFIG_OPENAI_CLIENT
+
+from .utils import ORJSONResponse
 
 from PersonalizeAI.nodes.phase2_retrieval import (
     contextual_query_generator,
@@ -20,8 +22,37 @@ class Phase2Request(BaseModel):
     segment_description: str
 
 
+async def retrieve_content(approach: Any, state: Dict[str, Any]) -> None:
+    """Fill `state["retrieved_content"]` for the current `context_query`.
+
+    Uses the approach's embedding + vector search when configured, otherwise
+    (or on failure) the local simulated retriever node.
+    """
+    if approach is not None:
+        # Use approach to compute embedding and run search so it respects configuration
+        try:
+            vec_query = await approach.compute_text_embedding(state["context_query"])
+            docs = await approach.search(
+                top=5,
+                query_text=state["context_query"],
+                filter=None,
+                vectors=[vec_query],
+                use_text_search=False,
+                use_vector_search=True,
+                use_semantic_ranker=False,
+                use_semantic_captions=False,
+            )
+            # Map Document dataclass to simple retrieved_content shape
+            state["retrieved_content"] = [{"text": d.content or "", "source_id": d.sourcepage or d.id or ""} for d in docs]
+            return
+        except Exception:
+            # Fallback to simulated retriever
+            pass
+    state.update(vector_search_retriever.vector_search_retriever(state))
+
+
 @router.post("/retrieval/run", tags=["Retrieval"])
-async def run_retrieval(request: Request, body: Phase2Request) -> Dict[str, Any]:
+async def run_retrieval(request: Request, body: Phase2Request) -> ORJSONResponse:
     """Orchestrate Phase 2 retrieval using services from the running FastAPI app.
 
     Strategy:
@@ -43,31 +74,7 @@ async def run_retrieval(request: Request, body: Phase2Request) -> Dict[str, Any]
     state.update(cq_update)
 
     # 2) Retrieve content (prefer approach utilities)
-    if approach is not None:
-        # Use approach to compute embedding and run search so it respects configuration
-        try:
-            vec_query = await approach.compute_text_embedding(state["context_query"])
-            docs = await approach.search(
-                top=5,
-                query_text=state["context_query"],
-                filter=None,
-                vectors=[vec_query],
-                use_text_search=False,
-                use_vector_search=True,
-                use_semantic_ranker=False,
-                use_semantic_captions=False,
-            )
-            # Map Document dataclass to simple retrieved_content shape
-            retrieved = []
-            for d in docs:
-                retrieved.append({"text": d.content or "", "source_id": d.sourcepage or d.id or ""})
-            state["retrieved_content"] = retrieved
-        except Exception:
-            # Fallback to simulated retriever
-            state.update(vector_search_retriever.vector_search_retriever(state))
-    else:
-        # No approach configured; use local simulated retriever node
-        state.update(vector_search_retriever.vector_search_retriever(state))
+    await retrieve_content(approach, state)
 
     # 3) Relevance grading and optional self-correction loop
     next_node = relevance_grader.relevance_grader(state)
@@ -88,29 +95,11 @@ async def run_retrieval(request: Request, body: Phase2Request) -> Dict[str, Any]
         state.update(sc_update)
 
         # Re-run retriever using approach if available
-        if approach is not None:
-            try:
-                vec_query = await approach.compute_text_embedding(state["context_query"])
-                docs = await approach.search(
-                    top=5,
-                    query_text=state["context_query"],
-                    filter=None,
-                    vectors=[vec_query],
-                    use_text_search=False,
-                    use_vector_search=True,
-                    use_semantic_ranker=False,
-                    use_semantic_captions=False,
-                )
-                retrieved = [{"text": d.content or "", "source_id": d.sourcepage or d.id or ""} for d in docs]
-                state["retrieved_content"] = retrieved
-            except Exception:
-                state.update(vector_search_retriever.vector_search_retriever(state))
-        else:
-            state.update(vector_search_retriever.vector_search_retriever(state))
+        await retrieve_content(approach, state)
 
         next_node = relevance_grader.relevance_grader(state)
 
     # 4) Citation formatting (finalize)
     signal = citation_formatter.citation_formatter(state)
 
-    return {"status": "success", "phase": "phase2", "signal": signal, "state": state}
+    return ORJSONResponse({"status": "success", "phase": "phase2", "signal": signal, "state": state})
@@ -1,11 +1,11 @@
 """User upload endpoints."""
 import io
 from fastapi import APIRouter, Depends, HTTPException, File, Request, UploadFile
-from fastapi.responses import JSONResponse
 
 from config import CONFIG_INGESTER, CONFIG_USER_BLOB_MANAGER, CONFIG_USER_UPLOAD_ENABLED
 from prepdocslib.listfilestrategy import File as PrepFile
 from ..dependencies import get_auth_claims
+from .utils import ORJSONResponse
 
 router = APIRouter()
 
@@ -38,9 +38,9 @@ async def upload(request: Request, file: UploadFile = File(...), auth_claims: di
         prep_file = PrepFile(content=io.BytesIO(content), acls={"oids": [user_oid]}, url=file_url)
         await ingester.add_file(prep_file, user_oid=user_oid)
 
-        return JSONResponse({"message": "File uploaded successfully"})
+        return ORJSONResponse({"message": "File uploaded successfully"})
     except Exception as error:
-        return JSONResponse({"message": "Error uploading file, check server logs for details.", "error": str(error)}, status_code=500)
+        return ORJSONResponse({"message": "Error uploading file, check server logs for details.", "error": str(error)}, status_code=500)
 
 
 @router.post("/delete_uploaded",tags=["Uploads"])
@@ -67,7 +67,7 @@ async def delete_uploaded(request: Request, auth_claims: dict = Depends(get_auth
     if ingester:
         await ingester.remove_file(filename, user_oid)
 
-    return JSONResponse({"message": f"File {filename} deleted successfully"})
+    return ORJSONResponse({"message": f"File {filename} deleted successfully"})
 
 
 @router.get("/list_uploaded",tags=["Uploads"])
@@ -85,4 +85,4 @@ async def list_uploaded(request: Request, auth_claims: dict = Depends(get_auth_c
         raise HTTPException(status_code=503, detail="User blob manager not configured")
 
     files = await adls_manager.list_blobs(user_oid)
-    return JSONResponse(files)
+    return ORJSONResponse(files)
@@ -1,6 +1,11 @@
-"""Shared utilities used by route modules (JSON encoder, NDJSON streamer)."""
+"""Shared utilities used by route modules (JSON encoder, JSON response, NDJSON streamer)."""
 import json
 from collections.abc import AsyncGenerator
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -20,6 +25,24 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+def orjson_default(o: Any) -> Any:
+    """orjson fallback matching JSONEncoder: dataclasses become dicts without None fields."""
+    if is_dataclass(o) and not isinstance(o, type):
+        return {k: v for k, v in asdict(o).items() if v is not None}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which encodes straight to UTF-8 bytes."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+
+
 async def ndjson_bytes(generator: AsyncGenerator[dict, None]):
     """Encode events from an async generator as NDJSON bytes."""
     try:
@@ -21,15 +21,10 @@ from azure.identity.aio import (
     ManagedIdentityCredential,
     get_bearer_token_provider,
 )
-from azure.monitor.opentelemetry import configure_azure_monitor
 from azure.search.documents.aio import SearchClient
 from azure.search.documents.indexes.aio import SearchIndexClient
 from azure.search.documents.knowledgebases.aio import KnowledgeBaseRetrievalClient
 from fastapi import FastAPI
-from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrumentor
-from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.openai import OpenAIInstrumentor
 
 from approaches.approach import Approach
 from approaches.chatreadretrieveread import ChatReadRetrieveReadApproach
@@ -464,6 +459,16 @@ async def setup_clients(app: FastAPI) -> None:
 
     # Instrumentation and telemetry if Application Insights configured
     if os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING"):
+        # Imported here so workers without Application Insights skip loading the
+        # Azure Monitor exporter and OpenTelemetry instrumentors at startup.
+        from azure.monitor.opentelemetry import configure_azure_monitor
+        from opentelemetry.instrumentation.aiohttp_client import (
+            AioHttpClientInstrumentor,
+        )
+        from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
+        from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+        from opentelemetry.instrumentation.openai import OpenAIInstrumentor
+
         logging.getLogger("uvicorn").info("APPLICATIONINSIGHTS_CONNECTION_STRING is set, enabling Azure Monitor")
         configure_azure_monitor(
             instrumentation_options={
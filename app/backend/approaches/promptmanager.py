@@ -21,8 +21,21 @@ class PromptyManager(PromptManager):
 
     PROMPTS_DIRECTORY = pathlib.Path(__file__).parent / "prompts"
 
+    def __init__(self):
+        # Parsed prompts keyed by path, so nodes that load a prompt on every
+        # request don't re-read and re-parse the .prompty file each time. Each
+        # entry remembers the file's mtime so edited prompts are picked up.
+        self.prompt_cache: dict[str, tuple[int, prompty.Prompty]] = {}
+
     def load_prompt(self, path: str):
-        return prompty.load(self.PROMPTS_DIRECTORY / path)
+        prompt_path = self.PROMPTS_DIRECTORY / path
+        mtime = prompt_path.stat().st_mtime_ns
+        cached = self.prompt_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        prompt = prompty.load(prompt_path)
+        self.prompt_cache[path] = (mtime, prompt)
+        return prompt
 
     def load_tools(self, path: str):
         return json.loads(open(self.PROMPTS_DIRECTORY / path).read())
@@ -1,4 +1,5 @@
 import csv
+import io
 from collections.abc import AsyncGenerator
 from typing import IO
 
@@ -19,8 +20,9 @@ class CsvParser(Parser):
         elif hasattr(content, "read"):  # Handle BufferedReader
             content_str = content.read().decode("utf-8")
 
-        # Create a CSV reader from the text content
-        reader = csv.reader(content_str.splitlines())
+        # Create a CSV reader that streams over the text content instead of
+        # materializing a list of lines first
+        reader = csv.reader(io.StringIO(content_str, newline=""))
         offset = 0
 
         # Skip the header row
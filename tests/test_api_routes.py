@@ -0,0 +1,108 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_ask_approach, get_auth_claims, get_chat_approach
+from api.routes import ask_chat, generation, health
+from approaches.approach import ThoughtStep
+from config import CONFIG_STREAMING_ENABLED
+
+
+@pytest.fixture
+def config_client():
+    app = FastAPI()
+    app.include_router(health.router)
+    app.state.config = {CONFIG_STREAMING_ENABLED: True}
+    with TestClient(app) as client:
+        yield client
+
+
+def test_config_returns_body_with_etag(config_client):
+    resp = config_client.get("/config")
+    assert resp.status_code == 200
+    assert resp.json()["streamingEnabled"] is True
+    assert resp.headers["etag"].startswith('"')
+    cfg, body, etag = config_client.app.state.config_response
+    assert cfg is config_client.app.state.config
+    assert body == resp.content
+    assert etag == resp.headers["etag"]
+
+
+def test_config_not_modified_for_matching_etag(config_client):
+    etag = config_client.get("/config").headers["etag"]
+    resp = config_client.get("/config", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+    assert resp.content == b""
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['W/{etag}', '"other", {etag}', '"other",W/{etag}', "*"],
+)
+def test_config_if_none_match_forms(config_client, if_none_match):
+    etag = config_client.get("/config").headers["etag"]
+    resp = config_client.get("/config", headers={"If-None-Match": if_none_match.format(etag=etag)})
+    assert resp.status_code == 304
+
+
+def test_config_stale_etag_gets_full_body(config_client):
+    resp = config_client.get("/config", headers={"If-None-Match": '"stale"'})
+    assert resp.status_code == 200
+    assert resp.json()["streamingEnabled"] is True
+
+
+def test_config_cache_resets_with_new_config(config_client):
+    etag = config_client.get("/config").headers["etag"]
+    config_client.app.state.config = {CONFIG_STREAMING_ENABLED: False}
+    resp = config_client.get("/config", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["streamingEnabled"] is False
+
+
+class DataclassResultApproach:
+    async def run(self, messages, context=None, session_state=None):
+        return {
+            "message": {"content": "reply", "role": "assistant"},
+            "context": {"thoughts": [ThoughtStep("Search", "query", None)]},
+            "session_state": session_state,
+        }
+
+
+@pytest.mark.parametrize("path", ["/ask", "/chat"])
+def test_ask_and_chat_serialize_dataclass_results(path):
+    app = FastAPI()
+    app.include_router(ask_chat.router)
+    app.state.config = {}
+    approach = DataclassResultApproach()
+    app.dependency_overrides[get_ask_approach] = lambda: approach
+    app.dependency_overrides[get_chat_approach] = lambda: approach
+    app.dependency_overrides[get_auth_claims] = lambda: {}
+
+    with TestClient(app) as client:
+        resp = client.post(path, json={"messages": [{"role": "user", "content": "hi"}], "session_state": "s1"})
+
+    assert resp.status_code == 200
+    assert resp.json()["context"]["thoughts"] == [{"title": "Search", "description": "query"}]
+
+
+def test_generation_router_serves_only_create_campaign():
+    app = FastAPI()
+    app.include_router(generation.router)
+
+    with TestClient(app) as client:
+        assert client.post("/generation/run", json={}).status_code == 404
+        resp = client.post("/create-campaign", json={"segment_id": "s1", "goal": "g"})
+
+    assert resp.status_code == 200
+    assert resp.json() == {"variants": [], "safety_logs": []}
+
+
+def test_chat_request_schema_is_published():
+    app = FastAPI()
+    app.include_router(ask_chat.router)
+
+    schemas = app.openapi()["components"]["schemas"]
+
+    assert {"AskRequest", "ChatRequest"} <= schemas.keys()
+    assert schemas["ChatRequest"]["properties"] == schemas["AskRequest"]["properties"]
@@ -1,4 +1,5 @@
 import json
+import os
 
 import pytest
 from azure.core.credentials import AzureKeyCredential
@@ -554,3 +555,27 @@ async def test_run_until_final_call_rejects_web_streaming(chat_approach):
             auth_claims={},
             should_stream=True,
         )
+
+
+def test_prompty_manager_caches_loaded_prompts():
+    prompt_manager = PromptyManager()
+    first = prompt_manager.load_prompt("chat_query_rewrite.prompty")
+    assert prompt_manager.load_prompt("chat_query_rewrite.prompty") is first
+    assert prompt_manager.load_prompt("chat_answer_question.prompty") is not first
+
+
+def test_prompty_manager_reloads_modified_prompts(tmp_path):
+    source = PromptyManager.PROMPTS_DIRECTORY / "ask_answer_question.prompty"
+    (tmp_path / "ask_answer_question.prompty").write_text(source.read_text())
+
+    class TmpPromptyManager(PromptyManager):
+        PROMPTS_DIRECTORY = tmp_path
+
+    prompt_manager = TmpPromptyManager()
+    first = prompt_manager.load_prompt("ask_answer_question.prompty")
+    assert prompt_manager.load_prompt("ask_answer_question.prompty") is first
+
+    prompt_path = tmp_path / "ask_answer_question.prompty"
+    stat = prompt_path.stat()
+    os.utime(prompt_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert prompt_manager.load_prompt("ask_answer_question.prompty") is not first
@@ -55,3 +55,32 @@ async def test_csvparser_empty_file():
 
     # Assertions
     assert len(pages) == 0  # No rows should be parsed from an empty file
+
+
+@pytest.mark.asyncio
+async def test_csvparser_quoted_multiline_cell():
+    # A quoted cell spanning lines stays part of a single row
+    file = io.BytesIO(b'col1,col2\n"line one\nline two",value2\nvalue3,value4')
+    file.name = "test.csv"
+    csvparser = CsvParser()
+
+    pages = [page async for page in csvparser.parse(file)]
+
+    assert len(pages) == 2
+    assert pages[0].text == "line one\nline two,value2"
+    assert pages[1].offset == len(pages[0].text) + 1
+    assert pages[1].text == "value3,value4"
+
+
+@pytest.mark.asyncio
+async def test_csvparser_form_feed_in_cell():
+    # Characters str.splitlines() treats as line breaks (\x0c, \x1c) don't split rows
+    file = io.BytesIO(b"col1,col2\npage\x0cbreak,group\x1csep\nvalue3,value4")
+    file.name = "test.csv"
+    csvparser = CsvParser()
+
+    pages = [page async for page in csvparser.parse(file)]
+
+    assert len(pages) == 2
+    assert pages[0].text == "page\x0cbreak,group\x1csep"
+    assert pages[1].text == "value3,value4"
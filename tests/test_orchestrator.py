@@ -0,0 +1,70 @@
+import pytest
+from PersonalizeAI import orchestrator
+
+
+@pytest.mark.asyncio
+async def test_call_node_state_only_node_gets_no_kwargs():
+    calls = []
+
+    def node(state):
+        calls.append(state)
+        return {"ok": True}
+
+    result = await orchestrator._call_node(node, {"a": 1}, openai_client=object(), approach=None)
+
+    assert result == {"ok": True}
+    assert calls == [{"a": 1}]
+
+
+@pytest.mark.asyncio
+async def test_call_node_passes_only_declared_kwargs():
+    async def node(state, openai_client=None):
+        return {"client": openai_client}
+
+    result = await orchestrator._call_node(node, {}, openai_client="client", prompt_manager="pm")
+
+    assert result == {"client": "client"}
+
+
+@pytest.mark.asyncio
+async def test_call_node_var_kwargs_node_gets_everything():
+    def node(state, **kwargs):
+        return kwargs
+
+    result = await orchestrator._call_node(node, {}, openai_client="client", prompt_manager="pm", approach=None)
+
+    assert result == {"openai_client": "client", "prompt_manager": "pm", "approach": None}
+
+
+@pytest.mark.asyncio
+async def test_call_node_internal_type_error_is_not_retried(capsys):
+    calls = []
+
+    def node(state, openai_client=None):
+        calls.append(openai_client)
+        raise TypeError("bad operand inside node")
+
+    result = await orchestrator._call_node(node, {}, openai_client="client")
+
+    assert result is None
+    assert calls == ["client"]
+    assert "bad operand inside node" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_relevance_grader_failure_propagates(monkeypatch):
+    def failing_grader(state):
+        raise RuntimeError("grader down")
+
+    real_load = orchestrator._load_node_group
+
+    def load_node_group(nodes):
+        loaded = real_load(nodes)
+        if nodes is orchestrator._PHASE2_NODES:
+            loaded = loaded[:2] + (failing_grader,) + loaded[3:]
+        return loaded
+
+    monkeypatch.setattr(orchestrator, "_load_node_group", load_node_group)
+
+    with pytest.raises(RuntimeError, match="grader down"):
+        await orchestrator.run_full_pipeline({"campaign_goal": "Reduce churn"})
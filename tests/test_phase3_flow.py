@@ -1,4 +1,6 @@
+import asyncio
 import json
+import re
 import pytest
 from types import SimpleNamespace
 
@@ -85,3 +87,109 @@ async def test_phase3_compliance_loop_with_llm():
 
     # All variants should now be compliant
     assert all(e["is_compliant"] for e in state["compliance_log"][-3:])
+
+
+@pytest.mark.asyncio
+async def test_phase3_compliance_deterministic_fallback():
+    state = {
+        "message_variants": [
+            {"id": "A", "subject": "S1", "body": "Safe body A", "cta": "CTA A"},
+            {"id": "B", "subject": "S2", "body": "Ensuring you meet your Fitness Goals.", "cta": "CTA B"},
+            {"id": "C", "subject": "S3", "body": "Offers tailored to your religion.", "cta": "CTA C"},
+        ],
+    }
+
+    comp_update = await compliance_agent.compliance_agent(state, openai_client=None, prompt_manager=None, approach=None)
+
+    verdicts = {e["variant_id"]: e for e in comp_update["compliance_log"]}
+    assert verdicts["A"]["is_compliant"]
+    assert not verdicts["B"]["is_compliant"]
+    assert "fitness goals" in verdicts["B"]["reason"]
+    assert not verdicts["C"]["is_compliant"]
+    assert verdicts["C"]["reason"] == "Targets sensitive attribute; violates policy."
+
+
+@pytest.mark.asyncio
+async def test_phase3_compliance_single_variant_with_llm():
+    fake_openai = FakeOpenAI([json.dumps({"is_compliant": False, "reason": "Off-brand tone."})])
+    state = {"message_variants": [{"id": "A", "subject": "S1", "body": "Safe body A", "cta": "CTA A"}]}
+
+    comp_update = await compliance_agent.compliance_agent(state, openai_client=fake_openai, prompt_manager=None, approach=None)
+
+    assert comp_update["compliance_log"] == [
+        {"variant_id": "A", "is_compliant": False, "reason": "Off-brand tone.", "timestamp": comp_update["compliance_log"][0]["timestamp"]}
+    ]
+
+
+class InFlightCountingOpenAI:
+    """Judge that tracks concurrent calls and finishes later variants first."""
+
+    def __init__(self, total):
+        self.in_flight = 0
+        self.peak = 0
+        self.total = total
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, *args, messages, **kwargs):
+        variant_id = int(re.search(r"'id': '(\d+)'", messages[-1]["content"]).group(1))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001 * (self.total - variant_id))
+        self.in_flight -= 1
+        content = json.dumps({"is_compliant": False, "reason": f"reason {variant_id}"})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.mark.asyncio
+async def test_phase3_compliance_bounds_concurrent_judge_calls_and_keeps_order():
+    total = 10
+    fake_openai = InFlightCountingOpenAI(total)
+    state = {
+        "message_variants": [
+            {"id": str(i), "subject": "S", "body": f"Safe body {i}", "cta": "CTA"} for i in range(total)
+        ]
+    }
+
+    comp_update = await compliance_agent.compliance_agent(state, openai_client=fake_openai, prompt_manager=None, approach=None)
+
+    assert total > compliance_agent.MAX_CONCURRENT_JUDGE_CALLS
+    assert 1 < fake_openai.peak <= compliance_agent.MAX_CONCURRENT_JUDGE_CALLS
+    assert [e["variant_id"] for e in comp_update["compliance_log"]] == [str(i) for i in range(total)]
+    assert [e["reason"] for e in comp_update["compliance_log"]] == [f"reason {i}" for i in range(total)]
+
+class CountingPromptManager:
+    def __init__(self):
+        self.loaded = []
+
+    def load_prompt(self, path):
+        self.loaded.append(path)
+        return path
+
+    def render_prompt(self, prompt, data):
+        return [{"role": "user", "content": f"{prompt}: {data['variant']['id']}"}]
+
+
+@pytest.mark.asyncio
+async def test_phase3_rewrite_loads_prompt_once_per_pass():
+    rewrites = [
+        json.dumps({"id": vid, "subject": "S", "body": f"Rewritten {vid}", "cta": "CTA"}) for vid in ("A", "B")
+    ]
+    fake_openai = FakeOpenAI(rewrites)
+    prompt_manager = CountingPromptManager()
+    state = {
+        "message_variants": [
+            {"id": "A", "subject": "S1", "body": "Body A", "cta": "CTA A"},
+            {"id": "B", "subject": "S2", "body": "Body B", "cta": "CTA B"},
+        ],
+        "compliance_log": [
+            {"variant_id": "A", "is_compliant": False, "reason": "r"},
+            {"variant_id": "B", "is_compliant": False, "reason": "r"},
+        ],
+    }
+
+    update = await automated_rewrite.automated_rewrite(
+        state, openai_client=fake_openai, prompt_manager=prompt_manager, approach=SimpleNamespace(chatgpt_deployment="gpt")
+    )
+
+    assert [v["body"] for v in update["message_variants"]] == ["Rewritten A", "Rewritten B"]
+    assert prompt_manager.loaded == ["phase3_generation/automated_rewrite.prompty"]